@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from .models import Author
 from pydantic import BaseModel
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from .role import staff_or_admin_required, get_current_user_jwt
+from .suggest_router import suggest_index
 import os
 import shutil
 
@@ -49,6 +52,45 @@ def staff_or_admin(user: UserStub = Depends(get_current_user)):
 
 
 
+# parses the fields= query parameter into model columns, None means every field
+def parse_fields(fields, schema, model):
+    if not fields:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    if not names:
+        return None
+    unknown = [name for name in names if name not in schema.__fields__]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return [getattr(model, name) for name in dict.fromkeys(names)]
+
+
+# serializes rows selected with parse_fields, bypassing the full response model
+def fields_response(rows):
+    return JSONResponse(jsonable_encoder([row._asdict() for row in rows]))
+
+
+# serializes a single row selected with parse_fields
+def fields_row_response(row):
+    return JSONResponse(jsonable_encoder(row._asdict()))
+
+
+# fields= query parameter, documents which field names schema allows
+def fields_query(schema):
+    return Query(None, description=(
+        f"Comma separated fields to return, any of: {', '.join(schema.__fields__)}. "
+        "Only these are selected and serialized, the others are left out of the response."
+    ))
+
+
+# openapi responses for endpoints taking fields=, since the response model only holds without it
+FIELDS_RESPONSES = {
+    200: {"description": "Full objects, or objects with only the fields named in fields= when it is given"},
+    400: {"description": "fields= names an unknown field"},
+}
+
+
+
 # pydantic schemas 
 class AuthorCreate(BaseModel):
     id: int
@@ -84,21 +126,29 @@ def create_author(author: AuthorCreate, db: Session = Depends(get_db)):
     db.add(db_author)
     db.commit()
     db.refresh(db_author)
+    suggest_index.add("author", db_author.id, db_author.name)
     return db_author
 
 
 
-@author_router.get("/", response_model=List[AuthorRead])   # get all the authors 
-def list_authors(db: Session = Depends(get_db)):
-    return db.query(Author).all()
+@author_router.get("/", response_model=List[AuthorRead], responses=FIELDS_RESPONSES)   # get all the authors 
+def list_authors(db: Session = Depends(get_db), fields: Optional[str] = fields_query(AuthorRead)):
+    columns = parse_fields(fields, AuthorRead, Author)
+    authors = db.query(*columns or [Author]).all()
+    if columns:
+        return fields_response(authors)
+    return authors
 
 
 
-@author_router.get("/{id}", response_model=AuthorRead) # get author by id 
-def get_author(id: int, db: Session = Depends(get_db)):
-    author = db.query(Author).filter(Author.id == id).first()
+@author_router.get("/{id}", response_model=AuthorRead, responses=FIELDS_RESPONSES) # get author by id 
+def get_author(id: int, db: Session = Depends(get_db), fields: Optional[str] = fields_query(AuthorRead)):
+    columns = parse_fields(fields, AuthorRead, Author)
+    author = db.query(*columns or [Author]).filter(Author.id == id).first()
     if not author:
         raise HTTPException(status_code=404, detail="Author not found")
+    if columns:
+        return fields_row_response(author)
     return author
 
 
@@ -115,6 +165,7 @@ def update_author(id: int, author_update: AuthorUpdate, db: Session = Depends(ge
         author.bio = author_update.bio
     db.commit()
     db.refresh(author)
+    suggest_index.add("author", author.id, author.name)
     return author
 
 
@@ -127,6 +178,7 @@ def delete_author(id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Author not found")
     db.delete(author)
     db.commit()
+    suggest_index.remove("author", id)
     return None 
 
 
@@ -7,6 +7,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from datetime import date, datetime
 from .role import staff_or_admin_required, get_current_user_jwt
+from .suggest_router import suggest_index
 import re
 import os
 import shutil
@@ -29,7 +30,7 @@ def get_db():
         db.close()
 
 # authentication and role dependency stubs
-from .author_router import get_current_user, staff_or_admin, UserStub
+from .author_router import get_current_user, staff_or_admin, UserStub, parse_fields, fields_response, fields_row_response, fields_query, FIELDS_RESPONSES
 
 
 
@@ -113,18 +114,22 @@ def create_book(book: BookCreate, db: Session = Depends(get_db)):
     db.add(db_book)
     db.commit()
     db.refresh(db_book)
+    suggest_index.add("book", db_book.id, db_book.title)
     return db_book
 
 
-@book_router.get("/", response_model=List[BookRead]) # get all the books 
+@book_router.get("/", response_model=List[BookRead], responses=FIELDS_RESPONSES) # get all the books 
 def list_books(
     db: Session = Depends(get_db),
     title: Optional[str] = Query(None),
     author_id: Optional[int] = Query(None),
     available: Optional[bool] = Query(None),
-    isbn: Optional[str] = Query(None)
+    isbn: Optional[str] = Query(None),
+    fields: Optional[str] = fields_query(BookRead)
 ):
-    query = db.query(Book)
+    # selects only the requested columns when fields= is given
+    columns = parse_fields(fields, BookRead, Book)
+    query = db.query(*columns or [Book])
     # filters the books by title, author_id, available, and isbn 
     if title:
         query = query.filter(Book.title.ilike(f"%{title}%"))
@@ -137,15 +142,20 @@ def list_books(
 
     if isbn:
         query = query.filter(Book.isbn == isbn)
+    if columns:
+        return fields_response(query.all())
     return query.all()
 
 
-@book_router.get("/{id}", response_model=BookRead) # get book by id 
-def get_book(id: int, db: Session = Depends(get_db)):
-    book = db.query(Book).filter(Book.id == id).first()
+@book_router.get("/{id}", response_model=BookRead, responses=FIELDS_RESPONSES) # get book by id 
+def get_book(id: int, db: Session = Depends(get_db), fields: Optional[str] = fields_query(BookRead)):
+    columns = parse_fields(fields, BookRead, Book)
+    book = db.query(*columns or [Book]).filter(Book.id == id).first()
 
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
+    if columns:
+        return fields_row_response(book)
     return book
 
 
@@ -181,6 +191,7 @@ def update_book(id: int, book_update: BookUpdate, db: Session = Depends(get_db))
         book.last_borrowed_date = book_update.last_borrowed_date
     db.commit()
     db.refresh(book)
+    suggest_index.add("book", book.id, book.title)
     return book
 
 
@@ -191,4 +202,5 @@ def delete_book(id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Book not found")
     db.delete(book)
     db.commit()
+    suggest_index.remove("book", id)
     return None 
\ No newline at end of file
@@ -2,12 +2,22 @@ from fastapi import FastAPI
 from .author_router import author_router
 from .book_router import book_router
 from .borrow_router import borrow_router
+from .suggest_router import suggest_router, start_index_build
 from .role import router
+from .compression import CompressionMiddleware
 
 
 app = FastAPI()
 
+# gzip/brotli compression for larger responses
+app.add_middleware(CompressionMiddleware)
+
 app.include_router(router)
 app.include_router(author_router)
 app.include_router(book_router)
-app.include_router(borrow_router) 
+app.include_router(borrow_router)
+app.include_router(suggest_router)
+
+# builds the /suggest index in the background
+app.add_event_handler("startup", start_index_build)
+
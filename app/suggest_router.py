@@ -0,0 +1,276 @@
+from fastapi import APIRouter, Query
+from sqlalchemy.orm import Session
+from typing import List
+from .models import Book, Author
+from pydantic import BaseModel
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from collections import defaultdict
+from array import array
+import bisect
+import heapq
+import threading
+import os
+import shutil
+
+# database setup
+db_path = os.path.join("/tmp", "library.db")
+if not os.path.exists(db_path):
+    shutil.copyfile(os.path.join(os.path.dirname(__file__), "..", "library.db"), db_path)
+DATABASE_URL = f"sqlite:///{db_path}"
+engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+
+# normalizes text so lookups are case and whitespace insensitive
+def normalize(text):
+    return " ".join(text.lower().split())
+
+
+# splits text into per word trigrams, padded like postgres pg_trgm so word starts and ends count
+def trigrams(text):
+    result = set()
+    for word in text.split():
+        padded = f" {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+
+# index limits, these keep memory and worst case query time bounded
+MAX_ENTRIES = 200000  # titles and names past this are not indexed
+MAX_LABEL_LENGTH = 128  # only the start of longer labels is indexed
+MAX_CANDIDATES = 64  # most labels the typo search scores per query
+MAX_QUERY_TRIGRAMS = 10  # rarest query trigrams the typo search picks and scores with
+TYPO_THRESHOLD = 0.4  # share of query trigrams a label needs to count as a typo match
+OFFSET_BITS = 8  # prefix keys pack (slot << OFFSET_BITS) | offset into one int
+OFFSET_MASK = (1 << OFFSET_BITS) - 1
+
+
+# in-memory index over book titles and author names
+class SuggestIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.built = False
+        self._pending = None  # changes made while a build runs, None when no build is running
+        self._slots = []  # slot -> (kind, id, label, normalized label), None when freed
+        self._free = []  # freed slots to reuse
+        self._slot_of = {}  # (kind, id) -> slot
+        self._starts = []  # whole label keys, sorted by label
+        self._words = []  # keys for the second and later words, sorted by the text from that word on
+        self._trigrams = defaultdict(lambda: array("I"))  # trigram -> sorted array of slots
+
+    # builds the index from the database once, without holding the lock so writes and searches never wait on it
+    def build(self, db: Session):
+        with self._lock:
+            if self.built or self._pending is not None:
+                return
+            self._pending = []
+        try:
+            books = db.query(Book.id, Book.title).order_by(Book.id).limit(MAX_ENTRIES).all()
+            authors = db.query(Author.id, Author.name).order_by(Author.id).limit(MAX_ENTRIES).all()
+            fresh = SuggestIndex()
+            fresh.load(books, authors)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+        with self._lock:
+            self._slots, self._free, self._slot_of = fresh._slots, fresh._free, fresh._slot_of
+            self._starts, self._words, self._trigrams = fresh._starts, fresh._words, fresh._trigrams
+            # replays changes that may have committed after the rows above were read
+            pending, self._pending = self._pending, None
+            for kind, id, label in pending:
+                self._apply(kind, id, label)
+            self.built = True
+
+    # replaces the index contents with the given (id, title) and (id, name) rows
+    def load(self, books, authors):
+        with self._lock:
+            self._slots, self._free, self._slot_of = [], [], {}
+            self._starts, self._words = [], []
+            self._trigrams = defaultdict(lambda: array("I"))
+            for kind, rows in (("book", books), ("author", authors)):
+                for id, label in rows:
+                    if len(self._slot_of) >= MAX_ENTRIES:
+                        break
+                    self._insert(kind, id, label, keep_sorted=False)
+            self._starts.sort(key=self._suffix)
+            self._words.sort(key=self._suffix)
+            self.built = True
+
+    # adds or replaces an entry, queued while a build runs and dropped before one starts since it reads the database
+    def add(self, kind, id, label):
+        self._change(kind, id, label)
+
+    # removes an entry
+    def remove(self, kind, id):
+        self._change(kind, id, None)
+
+    def _change(self, kind, id, label):
+        with self._lock:
+            if self.built:
+                self._apply(kind, id, label)
+            elif self._pending is not None:
+                self._pending.append((kind, id, label))
+
+    # replaces an entry, or removes it when label is None, caller must hold the lock
+    def _apply(self, kind, id, label):
+        self._delete(kind, id)
+        if label is not None and len(self._slot_of) < MAX_ENTRIES:
+            self._insert(kind, id, label, keep_sorted=True)
+
+    # returns up to limit (kind, id, label) matches, whole label prefixes first, then word prefixes, then typos
+    def search(self, q, limit=10):
+        q = normalize(q)[:MAX_LABEL_LENGTH]
+        if not q:
+            return []
+        with self._lock:
+            found, seen = [], set()
+            for keys in (self._starts, self._words):
+                i = bisect.bisect_left(keys, q, key=self._suffix)
+                while i < len(keys) and len(found) < limit:
+                    key = keys[i]
+                    i += 1
+                    if not self._suffix(key).startswith(q):
+                        break
+                    slot = key >> OFFSET_BITS
+                    if slot not in seen:
+                        seen.add(slot)
+                        found.append(slot)
+            if len(found) < limit:
+                found.extend(self._typo_matches(q, seen, limit - len(found)))
+            return [self._slots[slot][:3] for slot in found]
+
+    # scores labels sharing the query's rarest trigrams, so common ones like " th" never get walked in full
+    # and long queries cost no more than MAX_QUERY_TRIGRAMS lookups per candidate
+    def _typo_matches(self, q, seen, limit):
+        q_trigrams = trigrams(q)
+        present = [self._trigrams[trigram] for trigram in q_trigrams if trigram in self._trigrams]
+        if not present:
+            return []
+        buckets = sorted(present, key=len)[:MAX_QUERY_TRIGRAMS]
+        # trigrams missing from the index can match nothing, so they still count against every label
+        coverage = len(present) / len(q_trigrams)
+        candidates = set()
+        for bucket in buckets:
+            for slot in bucket:
+                if len(candidates) >= MAX_CANDIDATES:
+                    break
+                if slot not in seen:
+                    candidates.add(slot)
+        scored = []
+        for slot in candidates:
+            count = 0
+            for bucket in buckets:
+                i = bisect.bisect_left(bucket, slot)
+                count += i < len(bucket) and bucket[i] == slot
+            score = count / len(buckets) * coverage
+            if score >= TYPO_THRESHOLD:
+                label = self._slots[slot][2]
+                scored.append((-score, len(label), label, slot))
+        return [slot for *_, slot in heapq.nsmallest(limit, scored)]
+
+    # text a prefix key stands for, sliced from the stored label instead of kept as a copy
+    def _suffix(self, key):
+        return self._slots[key >> OFFSET_BITS][3][key & OFFSET_MASK:]
+
+    # indexes an entry, caller must hold the lock
+    def _insert(self, kind, id, label, keep_sorted):
+        norm = normalize(label)[:MAX_LABEL_LENGTH]
+        slot = self._free.pop() if self._free else len(self._slots)
+        if slot == len(self._slots):
+            self._slots.append(None)
+        self._slots[slot] = (kind, id, label, norm)
+        self._slot_of[(kind, id)] = slot
+        for trigram in trigrams(norm):
+            bucket = self._trigrams[trigram]
+            if keep_sorted and bucket and bucket[-1] > slot:
+                bisect.insort(bucket, slot)
+            else:
+                bucket.append(slot)
+        start = slot << OFFSET_BITS
+        words = [start | (i + 1) for i, char in enumerate(norm) if char == " "]
+        if keep_sorted:
+            bisect.insort(self._starts, start, key=self._suffix)
+            for key in words:
+                bisect.insort(self._words, key, key=self._suffix)
+        else:
+            self._starts.append(start)
+            self._words.extend(words)
+
+    # drops an entry from every structure and frees its slot, caller must hold the lock
+    def _delete(self, kind, id):
+        slot = self._slot_of.pop((kind, id), None)
+        if slot is None:
+            return
+        norm = self._slots[slot][3]
+        for trigram in trigrams(norm):
+            bucket = self._trigrams.get(trigram)
+            if bucket is not None:
+                i = bisect.bisect_left(bucket, slot)
+                if i < len(bucket) and bucket[i] == slot:
+                    del bucket[i]
+                if not bucket:
+                    del self._trigrams[trigram]
+        start = slot << OFFSET_BITS
+        self._remove_key(self._starts, start)
+        for i, char in enumerate(norm):
+            if char == " ":
+                self._remove_key(self._words, start | (i + 1))
+        self._slots[slot] = None
+        self._free.append(slot)
+
+    # removes key from a sorted key list, keys with equal text sit next to each other
+    def _remove_key(self, keys, key):
+        text = self._suffix(key)
+        i = bisect.bisect_left(keys, text, key=self._suffix)
+        while i < len(keys) and keys[i] != key and self._suffix(keys[i]) == text:
+            i += 1
+        if i < len(keys) and keys[i] == key:
+            del keys[i]
+
+
+suggest_index = SuggestIndex()
+
+
+# builds suggest_index with its own session
+def build_index():
+    db = SessionLocal()
+    try:
+        suggest_index.build(db)
+    finally:
+        db.close()
+
+
+# startup handler, builds the index in the background so startup stays cheap
+def start_index_build():
+    threading.Thread(target=build_index, daemon=True).start()
+
+
+
+# pydantic schemas
+class SuggestionRead(BaseModel):
+    type: str  # 'book' or 'author'
+    id: int
+    text: str
+
+
+
+# router
+suggest_router = APIRouter(tags=["suggest"])
+
+
+@suggest_router.get("/suggest", response_model=List[SuggestionRead]) # autocomplete book titles and author names
+def suggest(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50)
+):
+    # no suggestions until the startup build finishes
+    if not suggest_index.built:
+        return []
+    return [
+        SuggestionRead(type=kind, id=id, text=label)
+        for kind, id, label in suggest_index.search(q, limit)
+    ]
@@ -0,0 +1,94 @@
+# measures bytes on the wire and latency of GET /books/ with and without fields= and compression
+# run with: python benchmarks/bench_responses.py
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import tempfile
+import time
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.models import Base
+from app.compression import brotli
+from app import author_router, book_router, borrow_router, role
+
+SEED_FROM = 100000
+SEED_COUNT = 500
+RUNS = 50
+LINK_MBIT = 1.6  # downlink of a slow mobile connection (Chrome's "Fast 3G" preset), used for transfer time
+
+# throwaway database so benchmark rows never reach /tmp/library.db
+db_dir = tempfile.TemporaryDirectory()
+engine = create_engine(f"sqlite:///{os.path.join(db_dir.name, 'bench.db')}", connect_args={"check_same_thread": False})
+Base.metadata.create_all(engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+for module in (author_router, book_router, borrow_router, role):
+    app.dependency_overrides[module.get_db] = get_db
+
+client = TestClient(app)
+
+
+def seed():
+    client.post("/role/register", json={"username": "bench_admin", "password": "benchpass", "role": "admin"})
+    token = client.post("/role/login", json={"username": "bench_admin", "password": "benchpass"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post("/authors/", json={"id": SEED_FROM, "name": "Bench Author", "bio": ""}, headers=headers)
+    for i in range(SEED_FROM, SEED_FROM + SEED_COUNT):
+        client.post("/books/", json={
+            "id": i,
+            "title": f"Benchmark Book {i}",
+            "isbn": f"9{i:012d}",
+            "author_id": SEED_FROM,
+            "published_date": "2020-01-01",
+            "available": True,
+            "last_borrowed_date": "2024-01-01T12:00:00"
+        }, headers=headers)
+
+
+def measure(fields, encoding):
+    params = {"fields": fields} if fields else {}
+    headers = {"Accept-Encoding": encoding}
+    r = client.get("/books/", params=params, headers=headers)
+    size = r.num_bytes_downloaded
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        client.get("/books/", params=params, headers=headers)
+    return size, (time.perf_counter() - start) / RUNS * 1000
+
+
+def main():
+    seed()
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    baseline = None
+    # server ms is in-process TestClient time, transfer ms is bytes over a LINK_MBIT link
+    print(f"transfer at {LINK_MBIT} Mbit/s")
+    print(f"{'fields':<22}{'encoding':<10}{'bytes':>10}{'saved':>8}{'server ms':>11}{'transfer ms':>13}{'total ms':>10}")
+    for fields in [None, "id,title,available"]:
+        for encoding in encodings:
+            size, server_ms = measure(fields, encoding)
+            transfer_ms = size * 8 / (LINK_MBIT * 1000)
+            baseline = baseline or size
+            print(
+                f"{fields or 'all':<22}{encoding:<10}{size:>10}{1 - size / baseline:>8.0%}"
+                f"{server_ms:>11.2f}{transfer_ms:>13.1f}{server_ms + transfer_ms:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        engine.dispose()
+        db_dir.cleanup()
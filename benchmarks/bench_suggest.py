@@ -0,0 +1,89 @@
+# measures build time, memory and query latency of the /suggest index on synthetic titles and names
+# run with: python benchmarks/bench_suggest.py
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+import time
+import tracemalloc
+from app.suggest_router import SuggestIndex
+
+BOOKS = 100000
+AUTHORS = 20000
+RUNS = 200
+QUERIES = ["the", "harr", "ouxd", "qqqzzz", "tolkein", "lost lovers", "b", "the of and a in the of"]
+TYPO_QUERIES = 500  # real titles with one character dropped, cut to 12-40 characters
+
+
+# random pronounceable words so trigram buckets look like real text
+def make_words(rng, count):
+    syllables = [c + v for c in "bcdfghjklmnprstvwz" for v in "aeiou"]
+    return ["".join(rng.choice(syllables) for _ in range(rng.randint(1, 4))) for _ in range(count)]
+
+
+def make_rows(rng):
+    words = make_words(rng, 5000) + ["the", "of", "and", "a", "in"] * 200
+    books = [(i, " ".join(rng.choice(words) for _ in range(rng.randint(1, 6))).title()) for i in range(1, BOOKS + 1)]
+    authors = [(i, " ".join(rng.choice(words) for _ in range(2)).title()) for i in range(1, AUTHORS + 1)]
+    return books, authors
+
+
+# multi-word misspelled queries, plus one at the longest length the index looks at
+def make_typo_queries(rng, books):
+    queries = []
+    for _, title in rng.sample(books, TYPO_QUERIES):
+        title = (title + " ") * 8
+        i = rng.randrange(len(title) - 1)
+        queries.append((title[:i] + title[i + 1:])[:rng.randint(12, 40)])
+    queries.append(queries[-1] * 8)
+    return queries
+
+
+def timed_search(index, q):
+    start = time.perf_counter()
+    results = index.search(q)
+    return results, (time.perf_counter() - start) * 1000
+
+
+def main():
+    rng = random.Random(42)
+    books, authors = make_rows(rng)
+    index = SuggestIndex()
+
+    start = time.perf_counter()
+    index.load(books, authors)
+    print(f"build: {time.perf_counter() - start:.2f} s for {BOOKS} books and {AUTHORS} authors")
+
+    tracemalloc.start()
+    index.load(books, authors)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"index memory: {current / 1024 / 1024:.1f} MB")
+
+    print(f"{'query':<14}{'results':>8}{'p50 ms':>10}{'p99 ms':>10}")
+    for q in QUERIES:
+        timings = []
+        for _ in range(RUNS):
+            results, ms = timed_search(index, q)
+            timings.append(ms)
+        timings.sort()
+        print(f"{q[:13]:<14}{len(results):>8}{timings[RUNS // 2]:>10.3f}{timings[RUNS * 99 // 100]:>10.3f}")
+
+    timings, found = [], 0
+    for q in make_typo_queries(rng, books):
+        results, ms = timed_search(index, q)
+        timings.append(ms)
+        found += bool(results)
+    timings.sort()
+    n = len(timings)
+    print(f"{'misspelled':<14}{found:>8}{timings[n // 2]:>10.3f}{timings[n * 99 // 100]:>10.3f}  ({n} queries, max {timings[-1]:.3f} ms)")
+
+    start = time.perf_counter()
+    for i in range(1000):
+        index.add("book", BOOKS + i, f"Incremental Title {i}")
+    print(f"add: {time.perf_counter() - start:.3f} ms per book")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
+from app.suggest_router import build_index
 
 client = TestClient(app)
 
@@ -88,4 +89,72 @@ def test_borrow_return_workflow(setup_users_and_books):
     # Return all books
     for i in [2, 3, 4]:
         r = client.post(f"/return/{i}", headers=auth_headers(user_token))
-        assert r.status_code == 200 
\ No newline at end of file
+        assert r.status_code == 200 
+
+@pytest.fixture
+def sample_author_and_book(setup_users_and_books):
+    # Author and book with ids not in the seed database, removed even when the test fails
+    headers = auth_headers(setup_users_and_books["admin"])
+    try:
+        r = client.post("/authors/", json={"id": 9001, "name": "Zora Neale Hurston", "bio": "Novelist"}, headers=headers)
+        assert r.status_code == 201
+        r = client.post("/books/", json={
+            "id": 9001,
+            "title": "Their Eyes Were Watching God",
+            "isbn": "9780060838676",
+            "author_id": 9001,
+            "published_date": "1937-09-18"
+        }, headers=headers)
+        assert r.status_code == 201
+        yield headers
+    finally:
+        client.delete("/books/9001", headers=headers)
+        client.delete("/authors/9001", headers=headers)
+
+def test_suggest(sample_author_and_book):
+    headers = sample_author_and_book
+    build_index()
+    book = {"type": "book", "id": 9001, "text": "Their Eyes Were Watching God"}
+    author = {"type": "author", "id": 9001, "text": "Zora Neale Hurston"}
+    # Prefix match on the start of a title and on a later word
+    r = client.get("/suggest", params={"q": "their ey"})
+    assert r.status_code == 200
+    assert book in r.json()
+    assert book in client.get("/suggest", params={"q": "watching"}).json()
+    # Typo tolerant match on author names
+    assert author in client.get("/suggest", params={"q": "hurstn"}).json()
+    # Index follows updates and deletes
+    r = client.put("/authors/9001", json={"name": "Ursula Le Guin"}, headers=headers)
+    assert r.status_code == 200
+    assert author not in client.get("/suggest", params={"q": "zora"}).json()
+    assert {"type": "author", "id": 9001, "text": "Ursula Le Guin"} in client.get("/suggest", params={"q": "le guin"}).json()
+    assert client.delete("/books/9001", headers=headers).status_code == 204
+    assert client.delete("/authors/9001", headers=headers).status_code == 204
+    assert all(s["id"] != 9001 for s in client.get("/suggest", params={"q": "their eyes"}).json())
+    assert all(s["id"] != 9001 for s in client.get("/suggest", params={"q": "ursula"}).json())
+
+def test_sparse_fields(sample_author_and_book):
+    r = client.get("/books/", params={"fields": "id,title,available"})
+    assert r.status_code == 200
+    assert {"id": 9001, "title": "Their Eyes Were Watching God", "available": True} in r.json()
+    assert all(set(b) == {"id", "title", "available"} for b in r.json())
+    r = client.get("/books/9001", params={"fields": "title"})
+    assert r.json() == {"title": "Their Eyes Were Watching God"}
+    r = client.get("/authors/9001", params={"fields": "id,name"})
+    assert r.json() == {"id": 9001, "name": "Zora Neale Hurston"}
+    r = client.get("/authors/", params={"fields": "name"})
+    assert {"name": "Zora Neale Hurston"} in r.json()
+    assert all(set(a) == {"name"} for a in r.json())
+    # Unknown fields are rejected
+    r = client.get("/books/", params={"fields": "id,password"})
+    assert r.status_code == 400
+
+def test_response_compression(setup_users_and_books):
+    r = client.get("/books/", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert len(r.json()) >= 4
+    r = client.get("/books/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in r.headers
+    # Small responses are not compressed
+    r = client.get("/books/1", params={"fields": "id"}, headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers